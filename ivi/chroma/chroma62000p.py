@@ -34,6 +34,11 @@ class chroma62000p(chromaBaseDCPwr):
     def __init__(self, *args, **kwargs):
         self.__dict__.setdefault('_instrument_id', '')
 
+        # Setpoint writes waiting to be sent, keyed by SCPI header.  Only used
+        # when coalesce_writes is enabled.
+        self._coalesce_writes = False
+        self._pending_writes = dict()
+
         super(chroma62000p, self).__init__(*args, **kwargs)
 
         self._output_count = 1
@@ -68,8 +73,105 @@ class chroma62000p(chromaBaseDCPwr):
         self._add_property('outputs.slew_rate',
                          self._get_output_slew_rate,
                          self._set_output_slew_rate)
+        self._add_property('coalesce_writes',
+                        self._get_coalesce_writes,
+                        self._set_coalesce_writes,
+                        None,
+                        ivi.Doc("""
+                        If True, voltage level, current limit and OVP limit settings are queued
+                        rather than written immediately, and a newer value for the same setting
+                        replaces the queued one.  Queued settings are sent by apply(), before any
+                        other command, query or trigger, and when the session is closed.  Disabling
+                        coalescing sends any queued settings.  The default is False, where every
+                        setting is written to the instrument immediately.
+                        """))
+        self._add_method('apply',
+                        self._apply,
+                        ivi.Doc("""
+                        Sends any queued voltage level, current limit and OVP limit settings to
+                        the instrument.  Has no effect unless coalesce_writes is enabled.
+                        """))
         self._init_outputs()
 
+    def _get_coalesce_writes(self):
+        return self._coalesce_writes
+
+    def _set_coalesce_writes(self, value):
+        value = bool(value)
+        if not value:
+            self._flush_writes()
+        self._coalesce_writes = value
+
+    def _queue_write(self, key, data):
+        """
+        This function writes a setpoint command.  With coalesce_writes enabled the command is
+        queued instead, replacing any queued command with the same key so that only the most
+        recent value is sent.
+        """
+        if not self._coalesce_writes or not self._initialized or self._interface is None:
+            # write immediately, which also reports an uninitialized session at the call site
+            self._write(data)
+            return
+        self._pending_writes.pop(key, None)
+        self._pending_writes[key] = data
+
+    def _flush_writes(self):
+        """
+        This function sends all queued setpoint writes in the order they were last set.
+        """
+        if not self._pending_writes:
+            return
+        pending = list(self._pending_writes.values())
+        self._pending_writes.clear()
+        for data in pending:
+            super(chroma62000p, self)._write(data)
+
+    def _apply(self):
+        self._flush_writes()
+
+    # All I/O entry points send queued setpoints first so that they reach the
+    # instrument in order with any other command, query or trigger
+
+    def _write_raw(self, data):
+        self._flush_writes()
+        super(chroma62000p, self)._write_raw(data)
+
+    def _read_raw(self, num=-1):
+        self._flush_writes()
+        return super(chroma62000p, self)._read_raw(num)
+
+    def _ask_raw(self, data, num=-1):
+        self._flush_writes()
+        return super(chroma62000p, self)._ask_raw(data, num)
+
+    def _write(self, data, encoding = 'utf-8'):
+        self._flush_writes()
+        super(chroma62000p, self)._write(data, encoding)
+
+    def _read(self, num=-1, encoding = 'utf-8'):
+        self._flush_writes()
+        return super(chroma62000p, self)._read(num, encoding)
+
+    def _ask(self, data, num=-1, encoding = 'utf-8'):
+        self._flush_writes()
+        return super(chroma62000p, self)._ask(data, num, encoding)
+
+    def _read_stb(self):
+        self._flush_writes()
+        return super(chroma62000p, self)._read_stb()
+
+    def _trigger(self):
+        self._flush_writes()
+        super(chroma62000p, self)._trigger()
+
+    def _close(self):
+        try:
+            if self._initialized and self._interface is not None:
+                self._flush_writes()
+        finally:
+            self._pending_writes.clear()
+            super(chroma62000p, self)._close()
+
 
     # Tested on Chroma 62012P-80-60; working
     def _get_output_current_limit(self, index):
@@ -92,7 +194,7 @@ class chroma62000p(chromaBaseDCPwr):
         if value < 0 or value > self._output_spec[index]['current_max']:
             raise ivi.OutOfRangeException()
         if not self._driver_operation_simulate:
-            self._write("SOUR:CURR %.2f" % float(value))
+            self._queue_write("SOUR:CURR", "SOUR:CURR %.2f" % float(value))
         self._output_current_limit[index] = value
         self._set_cache_valid(index=index)
 
@@ -154,7 +256,7 @@ class chroma62000p(chromaBaseDCPwr):
         if value < 0 or value > self._output_voltage_max[index]:
             raise ivi.OutOfRangeException()
         if not self._driver_operation_simulate:
-            self._write("SOUR:VOLT %.2f" % float((value)))
+            self._queue_write("SOUR:VOLT", "SOUR:VOLT %.2f" % float((value)))
         self._output_voltage_level[index] = value
         self._set_cache_valid(index=index)
 
@@ -179,7 +281,7 @@ class chroma62000p(chromaBaseDCPwr):
         if value < 0 or value > self._output_spec[index]['ovp_max']:
             raise ivi.OutOfRangeException()
         if not self._driver_operation_simulate:
-            self._write("SOUR:VOLT:PROT:HIGH %.1f" % value)
+            self._queue_write("SOUR:VOLT:PROT:HIGH", "SOUR:VOLT:PROT:HIGH %.1f" % value)
         self._output_ovp_limit[index] = value
         self._set_cache_valid(index=index)
 
@@ -28,6 +28,20 @@ from .chroma62000p import *
 
 class chroma62012p40120(chroma62000p):
     "Chroma ATE 62012P-40-120 series IVI DC power supply driver"
+
+    # Fixed per-model output limits, copied into each instance since
+    # _output_configure_range updates voltage_max/current_max in place
+    _output_spec_template = (
+        {
+            'range': {
+                'P40V': (40.0, 120.0)
+            },
+            'ovp_max': 44.0,
+            'ocp_max': 132.0,
+            'voltage_max': 40.0,
+            'current_max': 120.0
+        },
+    )
     
     def __init__(self, *args, **kwargs):
         self.__dict__.setdefault('_instrument_id', '62012P-40-120')
@@ -36,17 +50,7 @@ class chroma62012p40120(chroma62000p):
         
         self._output_count = 1
         
-        self._output_spec = [
-            {
-                'range': {
-                    'P40V': (40.0, 120.0)
-                },
-                'ovp_max': 44.0,
-                'ocp_max': 132.0,
-                'voltage_max': 40.0,
-                'current_max': 120.0
-            }
-        ]
+        self._output_spec = [dict(spec) for spec in self._output_spec_template]
 
         self._init_outputs()
         
@@ -0,0 +1,134 @@
+"""
+
+Python Interchangeable Virtual Instrument Library
+
+Copyright (c) 2013-2017 Alex Forencich
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+
+import io
+import unittest
+
+from ... import ivi
+from ..chroma62000p import chroma62000p
+
+class Virtual62000P(object):
+    def __init__(self):
+        self.read_buffer = io.BytesIO()
+        self.cmd_log = list()
+
+        self.vals = {
+            'fetc:volt?': '12.00',
+            'fetc:curr?': '1.50',
+        }
+
+    def write_raw(self, data):
+        cmd = data.decode().strip()
+        self.cmd_log.append(cmd)
+
+        if '?' in cmd:
+            self.read_buffer = io.BytesIO(self.vals[cmd.lower()].encode())
+
+    def read_raw(self, num=-1):
+        return self.read_buffer.read(num)
+
+    def trigger(self):
+        self.cmd_log.append('<trigger>')
+
+
+class TestChroma62000P(unittest.TestCase):
+
+    def setUp(self):
+        self.vpsu = Virtual62000P()
+        self.psu = chroma62000p(self.vpsu)
+        del self.vpsu.cmd_log[:]
+
+    def test_immediate_writes_by_default(self):
+        self.assertEqual(self.psu.coalesce_writes, False)
+        self.psu.outputs[0].voltage_level = 10.0
+        self.psu.outputs[0].voltage_level = 12.0
+        self.psu.outputs[0].current_limit = 5.0
+        self.psu.outputs[0].ovp_limit = 20.0
+        self.assertEqual(self.vpsu.cmd_log,
+            ['SOUR:VOLT 10.00', 'SOUR:VOLT 12.00', 'SOUR:CURR 5.00', 'SOUR:VOLT:PROT:HIGH 20.0'])
+
+    def test_coalesce_replaces_queued_value(self):
+        self.psu.coalesce_writes = True
+        self.psu.outputs[0].voltage_level = 10.0
+        self.psu.outputs[0].ovp_limit = 20.0
+        self.psu.outputs[0].voltage_level = 12.0
+        self.psu.outputs[0].voltage_level = 14.0
+        self.assertEqual(self.vpsu.cmd_log, [])
+        self.assertEqual(self.psu.outputs[0].voltage_level, 14.0)
+        self.psu.apply()
+        self.assertEqual(self.vpsu.cmd_log, ['SOUR:VOLT:PROT:HIGH 20.0', 'SOUR:VOLT 14.00'])
+        self.psu.apply()
+        self.assertEqual(self.vpsu.cmd_log, ['SOUR:VOLT:PROT:HIGH 20.0', 'SOUR:VOLT 14.00'])
+
+    def test_flush_before_query(self):
+        self.psu.coalesce_writes = True
+        self.psu.outputs[0].voltage_level = 12.0
+        self.assertEqual(self.psu.outputs[0].measure('voltage'), 12.0)
+        self.assertEqual(self.vpsu.cmd_log, ['SOUR:VOLT 12.00', 'FETC:VOLT?'])
+
+    def test_flush_before_output_enable(self):
+        self.psu.coalesce_writes = True
+        self.psu.outputs[0].current_limit = 5.0
+        self.psu.outputs[0].voltage_level = 12.0
+        self.psu.outputs[0].enabled = True
+        self.assertEqual(self.vpsu.cmd_log, ['SOUR:CURR 5.00', 'SOUR:VOLT 12.00', 'CONF:OUTP ON'])
+
+    def test_flush_before_trigger(self):
+        self.psu.coalesce_writes = True
+        self.psu.outputs[0].voltage_level = 12.0
+        self.psu._trigger()
+        self.assertEqual(self.vpsu.cmd_log, ['SOUR:VOLT 12.00', '<trigger>'])
+
+    def test_flush_on_disable(self):
+        self.psu.coalesce_writes = True
+        self.psu.outputs[0].voltage_level = 12.0
+        self.psu.coalesce_writes = False
+        self.assertEqual(self.vpsu.cmd_log, ['SOUR:VOLT 12.00'])
+
+    def test_flush_on_close(self):
+        self.psu.coalesce_writes = True
+        self.psu.outputs[0].voltage_level = 12.0
+        self.psu.close()
+        self.assertEqual(self.vpsu.cmd_log, ['SOUR:VOLT 12.00'])
+        self.assertEqual(self.psu.initialized, False)
+
+    def test_close_after_failed_flush(self):
+        def write_raw(data):
+            raise IOError('instrument gone')
+        self.psu.coalesce_writes = True
+        self.psu.outputs[0].voltage_level = 12.0
+        self.vpsu.write_raw = write_raw
+        self.assertRaises(IOError, self.psu.close)
+        self.assertEqual(self.psu.initialized, False)
+
+    def test_coalesce_uninitialized(self):
+        psu = chroma62000p()
+        psu.coalesce_writes = True
+        def set_voltage():
+            psu.outputs[0].voltage_level = 12.0
+        self.assertRaises(ivi.NotInitializedException, set_voltage)
+        self.assertEqual(psu._pending_writes, {})
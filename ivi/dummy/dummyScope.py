@@ -29,8 +29,19 @@ from .. import ivi
 from .. import scope
 from .. import scpi
 
+import itertools
 from pathlib import Path
 
+_MEASUREMENT_FUNCTIONS = tuple(sorted(scope.MeasurementFunction))
+_MEASUREMENT_FUNCTION_SET = frozenset(_MEASUREMENT_FUNCTIONS)
+
+# Dense integer slot for each measurement function, so that the callback table
+# can be a list rather than a dict keyed on the measurement function name.
+_MEASUREMENT_FUNCTION_INDEX = dict(
+    (measurement_function, i)
+    for i, measurement_function in enumerate(_MEASUREMENT_FUNCTIONS)
+)
+
 class dummyScope(
     scpi.common.IdnCommand, scpi.common.Reset, scpi.common.Memory,
     scpi.common.SystemSetup, scope.Base, scope.WaveformMeasurement, 
@@ -65,6 +76,11 @@ class dummyScope(
         self._digital_channel_count = 0
         self._channel_count = 2
         self._bandwidth = 1e9
+        self._id_string_loaded = False
+
+        # Default for the fast option of initialize, which ivi.Driver does not
+        # forward from the constructor itself
+        self._initialize_fast = bool(kwargs.pop('fast', True))
 
         # Drop any pyvisa arguments if specified by the user.  We override them below.
         kwargs.pop('pyvisa_backend', None)
@@ -91,78 +107,90 @@ class dummyScope(
         self._identity_specification_minor_version = 1
         self._identity_supported_instrument_models =['dummyScope']
  
-        self.channels._add_property('label',
+        self._add_property('channels[].label',
                         self._get_channel_label,
-                        self._set_channel_label)
+                        self._set_channel_label,
+                        None,
+                        ivi.Doc("""
+                        Sets the channel label.
+                        """))
  
         self._init_channels()
         self._init_callbacks()
  
-    def initialize(self, resource = None, id_query = False, reset = False, **keywargs):
-        "Opens an I/O session to the instrument."
+    def _initialize(self, resource = None, id_query = False, reset = False, fast = None, **keywargs):
+        """Opens an I/O session to the instrument.
+
+        With fast set (the default, or as passed to the constructor) the interface clear
+        is skipped, as the dummy driver has no instrument state for it to act on.  The ID
+        check and reset still run when id_query or reset are requested.
+        """
  
+        if fast is None:
+            fast = self._initialize_fast
+
         self._channel_count = self._analog_channel_count + self._digital_channel_count
  
-        super(dummyScope, self).initialize(resource, id_query, reset, **keywargs)
+        super(dummyScope, self)._initialize(resource, id_query, reset, **keywargs)
  
         # interface clear
-        if not self._driver_operation_simulate:
+        if not fast and not self._driver_operation_simulate:
             self._clear()
  
         # check ID
         if id_query and not self._driver_operation_simulate:
             id = self.identity.instrument_model
             id_check = self._instrument_id
-            id_short = id[:len(id_check)]
-            if id_short != id_check:
-                raise Exception("Instrument ID mismatch, expecting %s, got %s", id_check, id_short)
+            if not id.startswith(id_check):
+                raise Exception("Instrument ID mismatch, expecting %s, got %s" % (id_check, id[:len(id_check)]))
  
         # reset
         if reset:
             self.utility.reset()
 
     def _init_channels(self):
-        try:
-            super(dummyScope, self)._init_channels()
-        except AttributeError:
-            pass
+        # Only swallow a missing base implementation, not AttributeErrors raised inside it
+        super_init_channels = getattr(super(dummyScope, self), '_init_channels', None)
+        if super_init_channels is not None:
+            super_init_channels()
 
-        # Add the channel lable placeholder. Other channel config handled by scope.Base
-        self._channel_label = list()
+        self._channel_name_dict = ivi.get_index_dict(self._channel_name)
 
-        for i in range(self._analog_channel_count):
-            self._channel_label.append("")
+        # Add the channel lable placeholder. Other channel config handled by scope.Base
+        self._channel_label = [""] * self._analog_channel_count
 
     def _init_callbacks(self):
-        self._callbacks = dict()
-        for measurement_function in scope.MeasurementFunction:
-            self._callbacks[measurement_function] = lambda: 0.0
+        # A C-level callable that always returns 0.0, avoiding a Python frame
+        # for every default measurement fetch.
+        default = itertools.repeat(0.0).__next__
+        self._callbacks = [default] * len(_MEASUREMENT_FUNCTIONS)
 
     def set_callback(self, measurement_function, callback):
-        assert (callable(callback))
-        self._callbacks[measurement_function] = callback
+        if measurement_function not in _MEASUREMENT_FUNCTION_SET:
+            raise ivi.ValueNotSupportedException()
+        if not callable(callback):
+            raise TypeError("callback must be callable")
+        self._callbacks[_MEASUREMENT_FUNCTION_INDEX[measurement_function]] = callback
  
     def _load_id_string(self):
         self._identity_instrument_manufacturer = "Dummy"
         self._identity_instrument_model = "dummyScope1234"
         self._identity_instrument_firmware_revision = "0.1"
+        self._id_string_loaded = True
  
     def _get_identity_instrument_manufacturer(self):
-        if self._get_cache_valid():
-            return self._identity_instrument_manufacturer
-        self._load_id_string()
+        if not self._id_string_loaded:
+            self._load_id_string()
         return self._identity_instrument_manufacturer
  
     def _get_identity_instrument_model(self):
-        if self._get_cache_valid():
-            return self._identity_instrument_model
-        self._load_id_string()
+        if not self._id_string_loaded:
+            self._load_id_string()
         return self._identity_instrument_model
  
     def _get_identity_instrument_firmware_revision(self):
-        if self._get_cache_valid():
-            return self._identity_instrument_firmware_revision
-        self._load_id_string()
+        if not self._id_string_loaded:
+            self._load_id_string()
         return self._identity_instrument_firmware_revision
  
     def _utility_disable(self):
@@ -177,7 +205,7 @@ class dummyScope(
         pass
  
     def _utility_reset(self):
-        pass
+        self._id_string_loaded = False
 
     def _utility_reset_with_defaults(self):
         self._utility_reset()
@@ -191,16 +219,18 @@ class dummyScope(
         pass
 
     def _get_channel_label(self, index):
-        index = ivi.get_index(self._channel_name, index)
+        index = ivi.get_index(self._channel_name_dict, index)
         return self._channel_label[index]
 
     def _set_channel_label(self, index, value):
         value = str(value)
-        index = ivi.get_index(self._channel_name, index)
+        index = ivi.get_index(self._channel_name_dict, index)
         self._channel_label[index] = value
 
     def _measurement_fetch_waveform_measurement(self, index, measurement_function):
-        index = ivi.get_index(self._channel_name, index)
-        if measurement_function not in scope.MeasurementFunction:
+        index = ivi.get_index(self._channel_name_dict, index)
+        try:
+            callback = self._callbacks[_MEASUREMENT_FUNCTION_INDEX[measurement_function]]
+        except KeyError:
             raise ivi.ValueNotSupportedException()
-        return self._callbacks[measurement_function]()
\ No newline at end of file
+        return callback()
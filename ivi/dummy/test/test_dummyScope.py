@@ -0,0 +1,158 @@
+"""
+
+Python Interchangeable Virtual Instrument Library
+
+Copyright (c) 2012-2017 Alex Forencich
+Copyright (c) 2023 IDEX Biometrics Ltd
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+"""
+
+
+import unittest
+
+from ... import ivi
+from .. import dummyScope
+
+RESOURCE = 'USB0::1234::5678::123456789::INSTR'
+
+class RecordingDummyScope(dummyScope):
+    "dummyScope that records the initialize steps it runs"
+
+    def __init__(self, *args, **kwargs):
+        self.steps = list()
+        self.model = 'dummyScope1234'
+        super(RecordingDummyScope, self).__init__(*args, **kwargs)
+
+    def _clear(self):
+        self.steps.append('clear')
+        super(RecordingDummyScope, self)._clear()
+
+    def _utility_reset(self):
+        self.steps.append('reset')
+        super(RecordingDummyScope, self)._utility_reset()
+
+    def _load_id_string(self):
+        super(RecordingDummyScope, self)._load_id_string()
+        self._identity_instrument_model = self.model
+
+
+class TestDummyScope(unittest.TestCase):
+
+    def setUp(self):
+        self.scope = dummyScope(RESOURCE)
+
+    def tearDown(self):
+        self.scope.close()
+
+    def fetch(self, channel, measurement_function):
+        return self.scope.channels[channel].measurement.fetch_waveform_measurement(measurement_function)
+
+    def test_default_callbacks(self):
+        for measurement_function in ('frequency', 'rise_time', 'voltage_rms'):
+            self.assertEqual(self.fetch(0, measurement_function), 0.0)
+
+    def test_set_callback(self):
+        self.scope.set_callback('frequency', lambda: 1e6)
+        self.scope.set_callback('voltage_rms', lambda: 0.5)
+        self.assertEqual(self.fetch(0, 'frequency'), 1e6)
+        self.assertEqual(self.fetch('channel1', 'frequency'), 1e6)
+        self.assertEqual(self.fetch(0, 'voltage_rms'), 0.5)
+        self.assertEqual(self.fetch(0, 'period'), 0.0)
+
+    def test_set_callback_unknown_function(self):
+        self.assertRaises(ivi.ValueNotSupportedException, self.scope.set_callback, 'bad_function', lambda: 1.0)
+
+    def test_set_callback_not_callable(self):
+        self.assertRaises(TypeError, self.scope.set_callback, 'frequency', 1.0)
+        self.assertEqual(self.fetch(0, 'frequency'), 0.0)
+
+    def test_fetch_unknown_function(self):
+        self.assertRaises(ivi.ValueNotSupportedException, self.fetch, 0, 'bad_function')
+
+    def test_fetch_bad_channel(self):
+        f = self.scope._measurement_fetch_waveform_measurement
+        self.assertRaises(ivi.SelectorRangeException, f, 5, 'frequency')
+        self.assertRaises(ivi.SelectorNameException, f, 'channel9', 'frequency')
+
+    def test_identity(self):
+        self.assertEqual(self.scope.identity.instrument_manufacturer, 'Dummy')
+        self.assertEqual(self.scope.identity.instrument_model, 'dummyScope1234')
+        self.assertEqual(self.scope.identity.instrument_firmware_revision, '0.1')
+
+    def test_reset_clears_identity(self):
+        self.assertEqual(self.scope.identity.instrument_model, 'dummyScope1234')
+        self.assertTrue(self.scope._id_string_loaded)
+        self.scope.utility.reset()
+        self.assertFalse(self.scope._id_string_loaded)
+        self.assertEqual(self.scope.identity.instrument_model, 'dummyScope1234')
+
+    def test_channel_label(self):
+        self.assertEqual(self.scope.channels[0].label, '')
+        self.scope.channels[0].label = 'clock'
+        self.assertEqual(self.scope.channels['channel1'].label, 'clock')
+        self.scope._set_channel_label('channel1', 'data')
+        self.assertEqual(self.scope._get_channel_label(0), 'data')
+        self.scope._set_channel_label(0, 1)
+        self.assertEqual(self.scope._get_channel_label('channel1'), '1')
+
+    def test_channel_label_bad_index(self):
+        self.assertRaises(ivi.SelectorRangeException, self.scope._get_channel_label, 5)
+        self.assertRaises(ivi.SelectorNameException, self.scope._set_channel_label, 'channel9', 'x')
+
+
+class TestDummyScopeInitialize(unittest.TestCase):
+
+    def tearDown(self):
+        self.scope.close()
+
+    def test_fast_default(self):
+        self.scope = RecordingDummyScope(RESOURCE)
+        self.assertEqual(self.scope.steps, [])
+        self.scope.initialize(RESOURCE)
+        self.assertEqual(self.scope.steps, [])
+
+    def test_initialize_not_fast(self):
+        self.scope = RecordingDummyScope(RESOURCE)
+        self.scope.initialize(RESOURCE, id_query=True, reset=True, fast=False)
+        self.assertEqual(self.scope.steps, ['clear', 'reset'])
+
+    def test_initialize_id_mismatch(self):
+        self.scope = RecordingDummyScope(RESOURCE)
+        self.scope.model = 'otherScope1234'
+        self.scope.utility.reset()
+        with self.assertRaises(Exception) as cm:
+            self.scope.initialize(RESOURCE, id_query=True, fast=False)
+        self.assertEqual(str(cm.exception), "Instrument ID mismatch, expecting dummyScope, got otherScope")
+
+    def test_constructor_not_fast(self):
+        self.scope = RecordingDummyScope(RESOURCE, True, True, fast=False)
+        self.assertEqual(self.scope.steps, ['clear', 'reset'])
+        self.scope.initialize(RESOURCE)
+        self.assertEqual(self.scope.steps, ['clear', 'reset', 'clear'])
+
+    def test_fast_runs_requested_steps(self):
+        self.scope = RecordingDummyScope(RESOURCE, id_query=True, reset=True)
+        self.assertEqual(self.scope.steps, ['reset'])
+        self.scope.model = 'otherScope1234'
+        self.scope.utility.reset()
+        with self.assertRaises(Exception) as cm:
+            self.scope.initialize(RESOURCE, id_query=True)
+        self.assertEqual(str(cm.exception), "Instrument ID mismatch, expecting dummyScope, got otherScope")
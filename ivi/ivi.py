@@ -182,10 +182,14 @@ class PropertyCollection(object):
         if name == '__dict__':
             return object.__getattribute__(self, name)
         d = object.__getattribute__(self, '__dict__')
-        d.setdefault('_props', dict())
+        # avoid allocating a default dict on every attribute read
+        try:
+            props = d['_props']
+        except KeyError:
+            props = d['_props'] = dict()
         d.setdefault('_locked', False)
-        if name in d['_props']:
-            f = d['_props'][name][0]
+        if name in props:
+            f = props[name][0]
             if f is None:
                 raise AttributeError("unreadable attribute")
             return f()
@@ -193,10 +197,13 @@ class PropertyCollection(object):
         
     def __setattr__(self, name, value):
         d = object.__getattribute__(self, '__dict__')
-        d.setdefault('_props', dict())
+        try:
+            props = d['_props']
+        except KeyError:
+            props = d['_props'] = dict()
         d.setdefault('_locked', False)
-        if name in d['_props']:
-            f = d['_props'][name][1]
+        if name in props:
+            f = props[name][1]
             if f is None:
                 raise AttributeError("can't set attribute")
             f(value)
@@ -207,10 +214,13 @@ class PropertyCollection(object):
         
     def __delattr__(self, name):
         d = object.__getattribute__(self, '__dict__')
-        d.setdefault('_props', dict())
+        try:
+            props = d['_props']
+        except KeyError:
+            props = d['_props'] = dict()
         d.setdefault('_locked', False)
-        if name in d['_props']:
-            f = d['_props'][name][2]
+        if name in props:
+            f = props[name][2]
             if f is None:
                 raise AttributeError("can't delete attribute")
             f()